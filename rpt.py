@@ -1,12 +1,50 @@
-import pandas as pd
-from matplotlib import pyplot as plt
-from docx import Document
-from docx.shared import Inches, Pt
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+# pandas, numpy, matplotlib and python-docx are imported inside the methods
+# that use them so that `--help` and early failures start up quickly
 from pathlib import Path
 import argparse
 from datetime import datetime
+import hashlib
+import io
+import math
 import os
+import re
+import tempfile
+
+# Markdown bullet line ("- item" or "* item"), capturing the item text
+_BULLET_RE = re.compile(r'^\s*[-*] (.*\S)', re.MULTILINE)
+
+# Bump whenever _read_excel/_read_excel_streaming change how data is parsed
+# so previously cached frames are not reused
+_DATA_CACHE_VERSION = 1
+
+# Chart appearance; part of the chart cache key together with the data
+_CHART_STYLE = {
+    'figsize': (12, 8),
+    'dpi': 150,  # Plenty for a 6.5in wide picture
+    'budgeted_color': '#2E8B57',
+    'remaining_color': '#4169E1',
+    'title': 'Budget Status by Task',
+    'xlabel': 'Project Tasks',
+    'ylabel': 'Amount ($)',
+}
+# Bump whenever _render_budget_chart changes so cached charts are re-rendered
+_CHART_RENDER_VERSION = 1
+
+
+def _fast_zip_pkg_writer(pkg_file):
+    """Create python-docx's zip package writer, deflating at level 1 instead of 6
+
+    Relies on python-docx internals as of python_docx==1.2.0 (pinned in
+    requirements.txt): PackageWriter.write() builds its writer through the
+    pkgwriter.PhysPkgWriter global, and the zip writer keeps its ZipFile in
+    _zipf and adds parts with writestr(), which uses the ZipFile's default
+    compresslevel. Re-check both when upgrading python-docx.
+    """
+    from docx.opc.phys_pkg import PhysPkgWriter
+
+    writer = PhysPkgWriter(pkg_file)
+    writer._zipf.compresslevel = 1
+    return writer
 
 
 class ReportGenerator:
@@ -15,10 +53,14 @@ class ReportGenerator:
         self.document = None
         self.data = None
         self._content_sections = None  # Cache for content.md sections
+        self._summary = None  # Budget totals, computed once in load_data
+        self._table_columns = None  # Source columns shown in the budget table
+        self._rows = None  # Data without the TOTALS row, filtered once in load_data
 
         # Create reports directory if it doesn't exist
         reports_dir = Path('reports')
         reports_dir.mkdir(exist_ok=True)
+        self.cache_dir = reports_dir / '.cache'
 
         # Simplified naming: project_report_yyyy-mm-dd.docx in reports folder
         if output_file is None:
@@ -39,35 +81,29 @@ class ReportGenerator:
         extension = base_filepath.suffix  # .docx
         parent_dir = base_filepath.parent
         
-        counter = 2
-        while True:
-            new_filename = f"{name_stem}_v{counter}{extension}"
-            new_filepath = parent_dir / new_filename
-            if not new_filepath.exists():
-                print(f"📝 File exists, creating new version: {new_filename}")
-                return new_filepath
-            counter += 1
-            
-            # Safety break to avoid infinite loop
-            if counter > 100:
-                # Use timestamp as fallback
-                timestamp = datetime.now().strftime("%H%M%S")
-                return parent_dir / f"{name_stem}_{timestamp}{extension}"
-            
+        # One directory scan to find the highest existing version number
+        version_re = re.compile(rf'{re.escape(name_stem)}_v(\d+){re.escape(extension)}$')
+        existing = [int(m.group(1)) for entry in os.scandir(parent_dir)
+                    if (m := version_re.match(entry.name))]
+        counter = max(existing, default=1) + 1
+
+        new_filename = f"{name_stem}_v{counter}{extension}"
+        print(f"📝 File exists, creating new version: {new_filename}")
+        return parent_dir / new_filename
+
     def _load_content_sections(self):
         """Load and cache all sections from content.md file once"""
         if self._content_sections is not None:
             return self._content_sections
             
         try:
-            content_file = Path('content.md')
-            if not content_file.exists():
+            # Read directly instead of exists() + open() to save a stat call
+            try:
+                content = Path('content.md').read_text(encoding='utf-8')
+            except FileNotFoundError:
                 print(f"Info: content.md not found, using default content")
                 self._content_sections = {}
                 return self._content_sections
-                
-            with open(content_file, 'r', encoding='utf-8') as f:
-                content = f.read()
             
             # Split content by headers (# Section Name)
             sections = {}
@@ -120,54 +156,203 @@ class ReportGenerator:
                 continue
 
             # Handle bullet points (markdown style) - removed bold formatting
-            if para.startswith('- ') or para.startswith('* '):
-                # Split multiple bullet points
-                bullets = [line.strip()[2:] for line in para.split(
-                    '\n') if line.strip().startswith(('- ', '* '))]
+            if para.startswith(('- ', '* ')):
+                # Extract all bullet points in a single regex scan
+                bullets = _BULLET_RE.findall(para)
                 for bullet in bullets:
                     self.document.add_paragraph(bullet, style='List Bullet')
             else:
                 # Regular paragraph
                 self.document.add_paragraph(para)
 
-    def _remove_table_borders(self, table):
-        """Efficiently remove borders from table"""
-        # Set table style to None to remove default borders
-        table.style = None
-        
-        # Remove borders at XML level for all existing and new cells
-        for row in table.rows:
-            for cell in row.cells:
-                tc = cell._tc
-                tcPr = tc.get_or_add_tcPr()
-                # Remove borders if they exist
-                tcBorders = tcPr.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tcBorders')
-                if tcBorders is not None:
-                    tcPr.remove(tcBorders)
-
-    def _format_cell_alignment(self, cell, column_index, is_header=False, is_total_row=False):
-        """Efficiently format cell alignment and styling"""
-        for paragraph in cell.paragraphs:
-            # Set font size
-            if paragraph.runs:
-                paragraph.runs[0].font.size = Pt(11)
-            
-            # Right-align numeric columns (1, 2, 3)
-            if column_index in [1, 2, 3]:
-                paragraph.alignment = WD_ALIGN_PARAGRAPH.RIGHT
-            
-            # Bold formatting for headers and totals
-            if is_header or is_total_row:
-                for run in paragraph.runs:
-                    run.bold = True
+    def _read_excel_streaming(self):
+        """Read the first sheet with openpyxl's read-only (streaming) reader"""
+        import pandas as pd
+        from openpyxl import load_workbook
+
+        wb = load_workbook(self.excel_file, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(values_only=True)
+            header = next(rows)
+            # Read-only sheets can report trailing blank rows, drop them
+            return pd.DataFrame(rows, columns=header).dropna(how='all')
+        finally:
+            wb.close()
+
+    def _read_excel(self):
+        """Parse the Excel file, preferring the calamine engine"""
+        import pandas as pd
+
+        try:
+            # calamine parses XLSX natively and is much faster than openpyxl
+            return pd.read_excel(self.excel_file, engine='calamine')
+        except ImportError:
+            return self._read_excel_streaming()
+
+    def _data_cache_path(self):
+        """Cache file for the parsed Excel data, keyed by reader version, path, mtime and size"""
+        excel_path = Path(self.excel_file).resolve()
+        stat = excel_path.stat()
+        key = hashlib.blake2b(
+            f"{_DATA_CACHE_VERSION}:{excel_path}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()[:16]
+        return self.cache_dir / f'data_{key}.pkl'
+
+    def _write_cache_file(self, cache_path, write):
+        """Atomically create a cache file via write(path) and prune stale entries"""
+        self.cache_dir.mkdir(exist_ok=True)
+        # Write to a temp file first so an interrupted run never leaves a
+        # truncated file at the final path
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_name)
+            os.replace(tmp_name, cache_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+        # Entries of one kind share a '<kind>_' prefix; older keys are never hit again
+        kind = cache_path.name.split('_', 1)[0]
+        for stale in self.cache_dir.glob(f'{kind}_*{cache_path.suffix}'):
+            if stale != cache_path:
+                stale.unlink(missing_ok=True)
+
+    def _format_table_values(self):
+        """Build table cell text column by column, choosing the format from the dtype"""
+        import numpy as np
+        import pandas as pd
+
+        def format_value(cell_value):
+            """Format a single value, adding thousands separators to numbers"""
+            # Plain isinstance checks instead of building a dtype for every value
+            if isinstance(cell_value, (int, float, np.integer, np.floating)) and not (
+                    isinstance(cell_value, (float, np.floating)) and math.isnan(cell_value)):
+                return f"{cell_value:,.0f}" if cell_value == int(cell_value) else f"{cell_value:,.2f}"
+            return str(cell_value)
+
+        formatted = pd.DataFrame(index=self.data.index)
+        for column in self._table_columns:
+            values = self.data[column]
+            if pd.api.types.is_integer_dtype(values):
+                formatted[column] = values.map('{:,.0f}'.format)
+            elif pd.api.types.is_float_dtype(values):
+                # Whole numbers drop their decimals, NaN falls through to 'nan'
+                formatted[column] = np.where(values == values.round(),
+                                             values.map('{:,.0f}'.format),
+                                             values.map('{:,.2f}'.format))
+            else:
+                # Mixed/object columns still need a per-value check
+                formatted[column] = values.map(format_value)
+        return formatted
+
+    def _append_table_rows(self, tbl, rows, is_header=False):
+        """Append rows of cell text to a <w:tbl> as raw <w:tr> elements
+
+        Header rows and rows whose first cell contains 'TOTAL' are bold; columns
+        1-3 are right-aligned and all text is 11pt.
+        """
+        from docx.oxml import OxmlElement
+        from docx.oxml.ns import qn
+
+        col_widths = [gridCol.w for gridCol in tbl.tblGrid.gridCol_lst]
+        for row_values in rows:
+            is_bold = is_header or 'TOTAL' in row_values[0].upper()
+            tr = OxmlElement('w:tr')
+            for j, text in enumerate(row_values):
+                tc = OxmlElement('w:tc')
+                if j < len(col_widths) and col_widths[j] is not None:
+                    tcPr = OxmlElement('w:tcPr')
+                    tcW = OxmlElement('w:tcW')
+                    tcW.set(qn('w:type'), 'dxa')
+                    tcW.set(qn('w:w'), str(col_widths[j].twips))
+                    tcPr.append(tcW)
+                    tc.append(tcPr)
+
+                p = OxmlElement('w:p')
+                # Right-align numeric columns (1, 2, 3)
+                if j in [1, 2, 3]:
+                    pPr = OxmlElement('w:pPr')
+                    jc = OxmlElement('w:jc')
+                    jc.set(qn('w:val'), 'right')
+                    pPr.append(jc)
+                    p.append(pPr)
+
+                r = OxmlElement('w:r')
+                rPr = OxmlElement('w:rPr')
+                if is_bold:
+                    rPr.append(OxmlElement('w:b'))
+                sz = OxmlElement('w:sz')
+                sz.set(qn('w:val'), '22')  # 11pt, in half-points
+                rPr.append(sz)
+                r.append(rPr)
+                r.text = text  # CT_R handles tabs, line breaks and whitespace
+                p.append(r)
+                tc.append(p)
+                tr.append(tc)
+            tbl.append(tr)
+
+    def _compute_summary(self):
+        """Compute budget totals and the Utilization% column once for all sections"""
+        import numpy as np
+
+        total_budgeted = self.data['Budgeted'].sum() if 'Budgeted' in self.data.columns else 0
+        total_remaining = self.data['Remaining'].sum() if 'Remaining' in self.data.columns else 0
+        utilization_rate = ((total_budgeted - total_remaining) /
+                            total_budgeted * 100) if total_budgeted > 0 else 0
+        self._summary = {
+            'budgeted': total_budgeted,
+            'remaining': total_remaining,
+            'utilization_rate': utilization_rate,
+        }
+
+        if all(col in self.data.columns for col in ['Budgeted', 'Remaining']):
+            # Fused in-place NumPy ops; rows with no budget stay NaN instead of inf
+            budgeted = self.data['Budgeted'].to_numpy(dtype=np.float64)
+            remaining = self.data['Remaining'].to_numpy(dtype=np.float64)
+            utilization = np.full_like(budgeted, np.nan)
+            np.divide(budgeted - remaining, budgeted, out=utilization, where=budgeted != 0)
+            utilization *= 100
+            np.round(utilization, 1, out=utilization)
+            self.data['Utilization%'] = utilization
 
     def load_data(self):
         """Load budget data from Excel file"""
+        import pandas as pd
+
         try:
-            self.data = pd.read_excel(self.excel_file)
+            # Caching is an optimization only, never fail the load over it
+            cache_path = self._data_cache_path()
+            try:
+                self.data = pd.read_pickle(cache_path)
+            except FileNotFoundError:
+                self.data = None
+            except Exception as e:
+                # Truncated or incompatible pickle: treat as a cache miss
+                print(f"Info: ignoring unreadable data cache: {e}")
+                try:
+                    cache_path.unlink(missing_ok=True)
+                except OSError:
+                    pass  # Overwritten below if the cache directory is writable
+                self.data = None
+
+            if self.data is None:
+                self.data = self._read_excel()
+                try:
+                    self._write_cache_file(cache_path, self.data.to_pickle)
+                except Exception as e:
+                    print(f"Info: could not cache parsed data: {e}")
             print(f"✅ Successfully loaded data from {self.excel_file}")
             print(f"   Columns: {list(self.data.columns)}")
             print(f"   Rows: {len(self.data)}")
+            # Columns shown in the budget table: as read, before Utilization% is added
+            self._table_columns = list(self.data.columns)
+            self._compute_summary()
+
+            # Filter out the TOTALS row once for the key points and chart
+            if 'Task' in self.data.columns:
+                self._rows = self.data[~self.data['Task'].str.contains('TOTAL', case=False, na=False)]
+            else:
+                self._rows = self.data
             return True
         except FileNotFoundError:
             print(f"❌ Error: Could not find {self.excel_file}")
@@ -178,6 +363,8 @@ class ReportGenerator:
 
     def create_document(self):
         """Initialize the Word document"""
+        from docx import Document
+
         self.document = Document()
         # Add title with current date
         title = f'Budget Report - {datetime.now().strftime("%B %d, %Y")}'
@@ -217,57 +404,33 @@ Key metrics include budget utilization rates, remaining fund allocation, and pro
         self.document.add_heading('Budget', level=1)
 
         # Add summary paragraph
-        total_budgeted = self.data['Budgeted'].sum(
-        ) if 'Budgeted' in self.data.columns else 0
-        total_remaining = self.data['Remaining'].sum(
-        ) if 'Remaining' in self.data.columns else 0
-        utilization_rate = ((total_budgeted - total_remaining) /
-                            total_budgeted * 100) if total_budgeted > 0 else 0
-
-        summary_text = f"Total Budget: ${total_budgeted:,.0f} | Utilization Rate: {utilization_rate:.1f}% | Remaining: ${total_remaining:,.0f}"
+        summary = self._summary
+        summary_text = f"Total Budget: ${summary['budgeted']:,.0f} | Utilization Rate: {summary['utilization_rate']:.1f}% | Remaining: ${summary['remaining']:,.0f}"
         self.document.add_paragraph(summary_text)
 
         # Create table
-        table = self.document.add_table(rows=1, cols=len(self.data.columns))
-        
-        # Remove all borders efficiently
-        self._remove_table_borders(table)
-
-        # Add header row with formatting
-        hdr_cells = table.rows[0].cells
-        for i, column_name in enumerate(self.data.columns):
-            hdr_cells[i].text = str(column_name)
-            self._format_cell_alignment(hdr_cells[i], i, is_header=True)
-
-        # Add data rows efficiently
-        for i, row_data in self.data.iterrows():
-            row_cells = table.add_row().cells
-            
-            # Remove borders from new row
-            for cell in row_cells:
-                tc = cell._tc
-                tcPr = tc.get_or_add_tcPr()
-                tcBorders = tcPr.find('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tcBorders')
-                if tcBorders is not None:
-                    tcPr.remove(tcBorders)
-            
-            is_total_row = 'TOTAL' in str(row_data.iloc[0]).upper()
-            
-            for j, cell_value in enumerate(row_data):
-                # Format numbers with commas if numeric
-                if pd.api.types.is_numeric_dtype(type(cell_value)) and pd.notna(cell_value):
-                    row_cells[j].text = f"{cell_value:,.0f}" if cell_value == int(cell_value) else f"{cell_value:,.2f}"
-                else:
-                    row_cells[j].text = str(cell_value)
-                
-                # Apply formatting
-                self._format_cell_alignment(row_cells[j], j, is_total_row=is_total_row)
+        table = self.document.add_table(rows=0, cols=len(self._table_columns))
+
+        # No table style, so no default borders; the rows appended below
+        # carry no tcBorders of their own
+        table.style = None
+
+        # Format all values up front so the row loop only assigns text
+        formatted = self._format_table_values()
+
+        # Append header and data rows directly as <w:tr> elements, bypassing
+        # table.add_row(); plain lists avoid itertuples' per-row namedtuples
+        self._append_table_rows(table._tbl, [[str(column_name) for column_name in self._table_columns]],
+                                is_header=True)
+        self._append_table_rows(table._tbl, formatted.to_numpy(dtype=object).tolist())
 
         print("✅ Budget table added")
         return True
 
     def add_key_points(self):
         """Add key points section"""
+        import numpy as np
+
         # Add space and intro sentence
         self.document.add_paragraph("")  # Empty paragraph for spacing
         self.document.add_paragraph("Summary of budget status:")
@@ -276,24 +439,19 @@ Key metrics include budget utilization rates, remaining fund allocation, and pro
         key_points = []
 
         if self.data is not None and all(col in self.data.columns for col in ['Budgeted', 'Remaining']):
-            # Calculate insights efficiently
-            total_budgeted = self.data['Budgeted'].sum()
-            total_remaining = self.data['Remaining'].sum()
-            utilization_rate = ((total_budgeted - total_remaining) / total_budgeted * 100) if total_budgeted > 0 else 0
+            # Totals and Utilization% are precomputed in load_data
+            total_remaining = self._summary['remaining']
+            utilization_rate = self._summary['utilization_rate']
 
             # Find highest and lowest utilization tasks efficiently
-            self.data['Utilization%'] = ((self.data['Budgeted'] - self.data['Remaining']) / self.data['Budgeted'] * 100).round(1)
-
             if len(self.data) > 1:
-                # Filter out totals row efficiently
-                non_total_data = self.data[~self.data['Task'].str.contains('TOTAL', case=False, na=False)] if 'Task' in self.data.columns else self.data
-                
-                if len(non_total_data) > 0:
-                    highest_util_idx = non_total_data['Utilization%'].idxmax()
-                    lowest_util_idx = non_total_data['Utilization%'].idxmin()
-                    
-                    highest_util = non_total_data.loc[highest_util_idx]
-                    lowest_util = non_total_data.loc[lowest_util_idx]
+                non_total_data = self._rows
+                utilization = non_total_data['Utilization%'].to_numpy()
+
+                # nanarg* skip rows without a budget, like idxmax/idxmin did
+                if len(non_total_data) > 0 and not np.isnan(utilization).all():
+                    highest_util = non_total_data.iloc[int(np.nanargmax(utilization))]
+                    lowest_util = non_total_data.iloc[int(np.nanargmin(utilization))]
 
                     key_points = [
                         f"Overall budget utilization stands at {utilization_rate:.1f}%",
@@ -316,8 +474,76 @@ Key metrics include budget utilization rates, remaining fund allocation, and pro
 
         print("✅ Key points section added")
 
+    def _render_budget_chart(self, chart_data, chart_file):
+        """Draw the budgeted vs remaining bar chart and save it as PNG"""
+        import numpy as np
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import FuncFormatter
+
+        # A standalone Figure (not pyplot) avoids pyplot's global state and is
+        # freed with the object instead of staying registered in pyplot
+        fig = Figure(figsize=_CHART_STYLE['figsize'])
+        ax = fig.subplots()
+
+        # Plot data
+        x_pos = np.arange(len(chart_data))
+        ax.bar(x_pos - 0.2, chart_data['Budgeted'], 0.4, label='Budgeted', color=_CHART_STYLE['budgeted_color'])
+        ax.bar(x_pos + 0.2, chart_data['Remaining'], 0.4, label='Remaining', color=_CHART_STYLE['remaining_color'])
+
+        # Formatting
+        ax.set_title(_CHART_STYLE['title'], fontsize=16, fontweight='bold', pad=20)
+        ax.set_xlabel(_CHART_STYLE['xlabel'], fontsize=12)
+        ax.set_ylabel(_CHART_STYLE['ylabel'], fontsize=12)
+        ax.set_xticks(x_pos)
+        ax.set_xticklabels(chart_data['Task'] if 'Task' in chart_data.columns else chart_data.index,
+                           rotation=45, ha='right')
+        ax.legend(loc='upper right')
+        ax.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'{x:,.0f}'))
+        ax.grid(axis='y', alpha=0.3)
+
+        fig.tight_layout()
+
+        # Save chart
+        fig.savefig(chart_file, format='png', bbox_inches='tight', dpi=_CHART_STYLE['dpi'], facecolor='white',
+                    pil_kwargs={'optimize': True})
+
+    def _prepare_budget_chart(self, use_cache=True):
+        """Return (PNG stream, from_cache) for the chart, rendering it only if not cached"""
+        import pandas as pd
+
+        # Use rows without TOTALS for better visualization
+        chart_data = self._rows
+
+        if len(chart_data) == 0:
+            chart_data = self.data
+
+        # Reuse the rendered chart while the plotted data and the chart
+        # code/appearance are unchanged
+        chart_key = hashlib.blake2b(repr((_CHART_RENDER_VERSION, _CHART_STYLE)).encode())
+        chart_key.update(pd.util.hash_pandas_object(chart_data, index=True).to_numpy().tobytes())
+        chart_hash = chart_key.hexdigest()[:16]
+        chart_filename = self.cache_dir / f'chart_{chart_hash}.png'
+        if use_cache:
+            try:
+                return io.BytesIO(chart_filename.read_bytes()), True
+            except FileNotFoundError:
+                pass
+
+        # Render into memory and hand these bytes to add_picture directly;
+        # the cache copy is only read back on later runs
+        chart_stream = io.BytesIO()
+        self._render_budget_chart(chart_data, chart_stream)
+        try:
+            self._write_cache_file(chart_filename, lambda path: Path(path).write_bytes(chart_stream.getvalue()))
+        except Exception as e:
+            print(f"Info: could not cache chart: {e}")
+        chart_stream.seek(0)
+        return chart_stream, False
+
     def add_budget_chart(self):
         """Add budget visualization chart"""
+        from docx.shared import Inches, Pt
+
         if self.data is None:
             print("❌ No data available for chart")
             return False
@@ -327,51 +553,26 @@ Key metrics include budget utilization rates, remaining fund allocation, and pro
         self.add_markdown_content('chart_description', chart_desc)
 
         try:
-            # Set matplotlib to non-interactive backend to prevent chart from showing
-            plt.ioff()
-
-            # Filter out TOTALS row for better visualization
-            chart_data = self.data[~self.data['Task'].str.contains('TOTAL', case=False, na=False)] if 'Task' in self.data.columns else self.data
-
-            if len(chart_data) == 0:
-                chart_data = self.data
-
-            # Create chart more efficiently
-            fig, ax = plt.subplots(figsize=(12, 8))
-            
-            # Plot data
-            x_pos = range(len(chart_data))
-            ax.bar([x - 0.2 for x in x_pos], chart_data['Budgeted'], 0.4, label='Budgeted', color='#2E8B57')
-            ax.bar([x + 0.2 for x in x_pos], chart_data['Remaining'], 0.4, label='Remaining', color='#4169E1')
-            
-            # Formatting
-            ax.set_title('Budget Status by Task', fontsize=16, fontweight='bold', pad=20)
-            ax.set_xlabel('Project Tasks', fontsize=12)
-            ax.set_ylabel('Amount ($)', fontsize=12)
-            ax.set_xticks(x_pos)
-            ax.set_xticklabels(chart_data['Task'] if 'Task' in chart_data.columns else chart_data.index, 
-                              rotation=45, ha='right')
-            ax.legend(loc='upper right')
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
-            ax.grid(axis='y', alpha=0.3)
-
-            plt.tight_layout()
-
-            # Save chart
-            chart_filename = 'budget_chart.png'
-            plt.savefig(chart_filename, bbox_inches='tight', dpi=300, facecolor='white')
-
-            # Add to document
-            self.document.add_picture(chart_filename, width=Inches(6.5))
+            chart_stream, from_cache = self._prepare_budget_chart()
+
+            # Add to document (same as document.add_picture, but keeps the run
+            # so a bad cached image can be replaced without an empty paragraph)
+            picture_run = self.document.add_paragraph().add_run()
+            try:
+                picture_run.add_picture(chart_stream, width=Inches(6.5))
+            except Exception as e:
+                if not from_cache:
+                    raise
+                # Corrupt cache entry: render the chart again and overwrite it
+                print(f"Info: ignoring unreadable cached chart: {e!r}")
+                chart_stream, _ = self._prepare_budget_chart(use_cache=False)
+                picture_run.add_picture(chart_stream, width=Inches(6.5))
             
             # Add figure caption in 9pt font
             caption_paragraph = self.document.add_paragraph("Figure 1: Total amounts budgeted and remaining by project task.")
             caption_run = caption_paragraph.runs[0]
             caption_run.font.size = Pt(9)
 
-            # Close the figure to prevent display and free memory
-            plt.close(fig)
-
             print("✅ Budget chart added")
             return True
 
@@ -407,8 +608,16 @@ Key metrics include budget utilization rates, remaining fund allocation, and pro
 
     def save_document(self):
         """Save the Word document"""
+        from docx.opc import pkgwriter
+
         try:
-            self.document.save(self.output_file)
+            # Swap in the faster zip writer factory for this save only
+            default_writer = pkgwriter.PhysPkgWriter
+            pkgwriter.PhysPkgWriter = _fast_zip_pkg_writer
+            try:
+                self.document.save(self.output_file)
+            finally:
+                pkgwriter.PhysPkgWriter = default_writer
             print(f"✅ Report saved successfully: {self.output_file}")
             return True
         except Exception as e: